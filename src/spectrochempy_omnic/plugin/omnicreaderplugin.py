@@ -10,24 +10,25 @@ hookimpl = HookimplMarker("spectrochempy")
 class OMNICReaderPlugin(ReaderPlugin):
     """Reader for Omnic files."""
 
+    # built once, as the file type info is requested for every file type lookup
+    _filetype_info = {
+        "identifier": "omnic",
+        "description": "Nicolet OMNIC files and series (*.spa *.spg *.srs)",
+        "extensions": ["spa", "spg", "srs"],
+        "reader_method": "read_omnic",
+    }
+
     # Hooks implementation
     # --------------------
     @hookimpl
     def get_filetype_info(self):
-        return {
-            "identifier": "omnic",
-            "description": "Nicolet OMNIC files and series (*.spa *.spg *.srs)",
-            "extensions": ["spa", "spg", "srs"],
-            "reader_method": "read_omnic",
-        }
+        return self._filetype_info
 
     @hookimpl
     def read_file(self, filenames: list, protocol: str = None, **kwargs) -> object:
-        nds = []
-        for filename in filenames:
-            nd = OMNICReader(filename, protocol=protocol, **kwargs)
-            if nd.data is not None:
-                nds.append(nd)
+        # files are read concurrently (results keep the order of filenames)
+        nds = OMNICReader.read_many(filenames, protocol=protocol, **kwargs)
+        nds = [nd for nd in nds if nd.data is not None]
         return nds if len(nds) > 0 else None
 
     @hookimpl
@@ -8,19 +8,25 @@
 
 __all__ = ["OMNICReader"]
 
+import copy
+import functools
 import io
 import logging
+import mmap
+import os
 import re
 import struct
 import sys
+import threading
 import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import timedelta
 from pathlib import Path
-from zoneinfo import ZoneInfo
+from urllib.parse import urlsplit
 
 import numpy as np
-import requests
 
 # ======================================================================
 # UTC timezone
@@ -47,16 +53,87 @@ class OMNICReaderWarning(Warning):
 # ======================================================================
 # Utility functions
 # ======================================================================
+
+# OMNIC files are little-endian: numpy dtypes used for array reads and
+# precompiled structs used for single-value reads
+_NP_DTYPE = {
+    "uint8": np.dtype("<u1"),
+    "int8": np.dtype("<i1"),
+    "uint16": np.dtype("<u2"),
+    "int16": np.dtype("<i2"),
+    "uint32": np.dtype("<u4"),
+    "int32": np.dtype("<i4"),
+    "float32": np.dtype("<f4"),
+    "char8": np.dtype("S1"),
+}
+_STRUCT_ONE = {
+    "uint8": struct.Struct("<B"),
+    "int8": struct.Struct("<b"),
+    "uint16": struct.Struct("<H"),
+    "int16": struct.Struct("<h"),
+    "uint32": struct.Struct("<I"),
+    "int32": struct.Struct("<i"),
+    "float32": struct.Struct("<f"),
+    "char8": struct.Struct("<c"),
+}
+
+
+# OMNIC dates are stored as seconds since 31/12/1899, 00:00 (GMT): this origin and
+# its POSIX timestamp. Dates are built from the origin plus a timedelta, as
+# datetime.fromtimestamp fails on some platforms (Windows) before 1970.
+_OMNIC_EPOCH_DATE = datetime(1899, 12, 31, tzinfo=UTC)
+_OMNIC_EPOCH = _OMNIC_EPOCH_DATE.timestamp()
+
+
+# files larger than this size (in bytes) are memory-mapped instead of being read at
+# once: below ~1 MiB a single read is cheaper than setting up the mapping
+_MMAP_THRESHOLD = 1024**2
+
+
+class _Cursor:
+    """
+    Minimal read-only file-like object over a bytes-like or memory-mapped buffer.
+
+    Reads through `fromfile` are decoded directly from the buffer at the current
+    position, without intermediate bytes objects.
+    """
+
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf):
+        self.buf = buf
+        self.pos = 0
+
+    def seek(self, pos):
+        self.pos = pos
+
+    def tell(self):
+        return self.pos
+
+    def read(self, size=-1):
+        end = len(self.buf) if size is None or size < 0 else self.pos + size
+        data = self.buf[self.pos : end]
+        self.pos += len(data)
+        return data
+
+    def find(self, sub, start=0):
+        return self.buf.find(sub, start)
+
+    def close(self):
+        if isinstance(self.buf, mmap.mmap):
+            self.buf.close()
+
+
 def fromfile(fid, dtype, count):
     """
-    Read binary data from a file-like object as a numpy array or scalar.
+    Read binary data from a file buffer as a numpy array or scalar.
 
-    This function replaces np.fromfile for io.BytesIO objects.
+    This function replaces np.fromfile for in-memory or memory-mapped files.
 
     Parameters
     ----------
-    fid : file-like object
-        File-like object to read from.
+    fid : _Cursor
+        Cursor over the file buffer, at the position of the data to read.
     dtype : str
         Data type to read ('uint8', 'int8', 'uint16', 'int16', 'uint32', 'int32', 'float32', 'char8').
     count : int
@@ -67,26 +144,204 @@ def fromfile(fid, dtype, count):
     numpy.ndarray or scalar
         The data read from the file.
     """
-    t = {
-        "uint8": "B",
-        "int8": "b",
-        "uint16": "H",
-        "int16": "h",
-        "uint32": "I",
-        "int32": "i",
-        "float32": "f",
-        "char8": "c",
+    # decode in place: no intermediate bytes object
+    dt = _NP_DTYPE[dtype]
+    if count == 1:
+        out = _STRUCT_ONE[dtype].unpack_from(fid.buf, fid.pos)[0]
+    else:
+        # copy, so that the buffer (possibly a mmap) can be closed afterwards
+        out = np.frombuffer(fid.buf, dtype=dt, count=count, offset=fid.pos).copy()
+    fid.pos += dt.itemsize * count
+    return out
+
+
+# precompiled structs for the reads of the header/key fields, unpacked directly
+# from the buffer at a given offset
+_U8 = _STRUCT_ONE["uint8"]
+_U16 = _STRUCT_ONE["uint16"]
+_U32 = _STRUCT_ONE["uint32"]
+# position and size following a key
+_U32_PAIR = struct.Struct("<II")
+# spectrum title (256 bytes) and acquisition date of the spg files
+_TITLE = struct.Struct("<256sI")
+
+
+# a key 00 or 01 marks the end of a block of lines
+_END_KEY_RE = re.compile(b"[\x00\x01]")
+
+
+def _scan_keys(fid, pos, block=64):
+    # Keys (first byte) of the consecutive 16-byte lines of a _Cursor starting at
+    # `pos`, up to the end of the block of lines. The keys are extracted by
+    # chunks of `block` lines with a strided slice of the buffer, and the end of
+    # the block is searched in C.
+    keys = b""
+    while pos < len(fid.buf):
+        chunk = fid.buf[pos : pos + 16 * block : 16]
+        end = _END_KEY_RE.search(chunk)
+        if end is not None:
+            return keys + chunk[: end.start()]
+        keys += chunk
+        pos += 16 * block
+    return keys
+
+
+# a 16-byte line of the key table (from offset 304): key, then position and size of
+# the block it points to
+_KEY_LINE = np.dtype(
+    {
+        "names": ["key", "pos", "size"],
+        "formats": ["u1", "<u4", "<u4"],
+        "offsets": [0, 2, 6],
+        "itemsize": 16,
     }
-    typ = t[dtype] * count
-    if dtype.endswith("16"):
-        count *= 2
-    elif dtype.endswith("32"):
-        count *= 4
+)
+
+# keys of the spa lines giving the intensities, depending on the `interferogram`
+# option (see OMNICReader._read_spa)
+_SPA_INTENSITY_KEYS = {None: 3, "sample": 102, "background": 103}
+
+# sequences used to identify the type of srs files and locate their headers and data
+# (see OMNICReader._read_srs). The TGA/IR or GC one is common to the two others.
+_SRS_RS = b"\x02\x00\x00\x00\x18\x00\x00\x00\x00\x00\x48\x43\x00\x50\x43\x47"
+_SRS_HS = b"\x02\x00\x00\x00\x18\x00\x00\x00\x00\x00\x48\x43\x00\xc8\xaf\x47"
+_SRS_TG = b"\x02\x00\x00\x00\x18\x00\x00\x00\x00\x00"
+
+
+def _find_all(buf, sub, start=0):
+    # Positions of all the occurrences of sub in buf, from `start`. Successive
+    # bytes.find/mmap.find calls (fast search in C) are faster here than a regex
+    # scan or a numpy comparison of the whole buffer.
+    index = []
+    pos = buf.find(sub, start)
+    while pos != -1:
+        index.append(pos)
+        pos = buf.find(sub, pos + 1)
+    return index
+
+
+# fixed-offset fields of a spectrum/ifg/series header (see OMNICReader._read_header),
+# unpacked at once: nx (4), xunits key (8), data units key (12), firstx (16),
+# lastx (20), scan_pts (28), zpd (32), nscan (36), nbkgscan (52), collection length
+# (68), reference frequency (80) and optical velocity (188)
+_HEADER = struct.Struct("<4xIB3xB3xff4xIII12xI12xI8xf104xf")
+_HEADER_FIELDS = (
+    "nx",
+    "xunits_key",
+    "units_key",
+    "firstx",
+    "lastx",
+    "scan_pts",
+    "zpd",
+    "nscan",
+    "nbkgscan",
+    "collection_length",
+    "reference_frequency",
+    "optical_velocity",
+)
+
+# additional fields of the srs series headers, from offset 1002 of the header:
+# collection length (1002), last y (1006), first y (1010) and ny (1026)
+_SRS_HEADER = struct.Struct("<fff12xI")
+_SRS_HEADER_FIELDS = ("collection_length", "lasty", "firsty", "ny")
+
+
+# (units, title) of the x axis and of the data, by header key (see
+# OMNICReader._read_header)
+_XUNITS = {
+    1: ("cm^-1", "wavenumbers"),
+    2: (None, "data points"),
+    3: ("nm", "wavelengths"),
+    4: ("um", "wavelengths"),
+    32: ("cm^-1", "raman shift"),
+}
+_UNITS = {
+    17: ("absorbance", "absorbance"),
+    16: ("percent", "transmittance"),
+    11: ("percent", "reflectance"),
+    12: (None, "log(1/R)"),
+    15: (None, "single beam"),
+    20: ("Kubelka_Munk", "Kubelka-Munk"),
+    21: (None, "reflectance"),
+    22: ("V", "detector signal"),
+    26: (None, "photoacoustic"),
+    31: (None, "Raman intensity"),
+}
+
+
+def _detect_filetype(buf):
+    # type of file from its signature: "spa, spg", "srs" or None if unknown
+    signature = buf[:18]
+    if signature == b"Spectral Data File":
+        return "spa, spg"
+    if signature == b"Spectral Exte File":
+        return "srs"
+    return None
+
+
+def _nan_mask(data):
+    # Mask of the blanked (NaN) values of data, or None if there is none: the full
+    # boolean array is only built when a single reduction finds a NaN (an empty
+    # series has none, and np.min cannot reduce it)
+    return np.isnan(data) if data.size and np.isnan(np.min(data)) else None
+
+
+# parsed local files are cached (see _cached_state); larger files are always parsed
+# again, so as not to keep large series alive in memory
+_CACHE_MAX_SIZE = 8 * 1024**2
+
+
+@functools.lru_cache(maxsize=16)
+def _read_cached(path, abspath, mtime_ns, size, options):
+    # Decoded state of a reader of the file at path (abspath), as it was
+    # (mtime_ns, size) when parsed. The path is kept as given, as it is recorded by
+    # the readers. The history is kept as its messages, which each reader adds again
+    # with its own timestamp.
+    reader = OMNICReader(path, cache=False, **dict(options))
+    state = {
+        name: getattr(reader, name)
+        for name in OMNICReader.__slots__
+        if name != "_history"
+    }
+    messages = tuple(entry.split("> ", 1)[1] for entry in reader.history)
+    return state, messages
+
+
+def _cached_state(source, kwargs):
+    # parsed state of a local file, or None if it cannot be cached
+    if not isinstance(source, Path):
+        return None
+    try:
+        stat = source.stat()
+    except FileNotFoundError:
+        return None  # reported when opening the file
+    if stat.st_size > _CACHE_MAX_SIZE:
+        return None
+    options = tuple(sorted(kwargs.items()))
+    try:
+        hash(options)
+    except TypeError:
+        return None
+    return _read_cached(
+        source, os.path.abspath(source), stat.st_mtime_ns, stat.st_size, options
+    )
+
+
+_URL_RE = re.compile(r"https?://")
+
+# HTTP sessions (keeping connections alive between the reads of remote files), one
+# per thread as requests sessions are not thread-safe
+_http_local = threading.local()
 
-    out = struct.unpack(typ, fid.read(count))
-    if len(out) == 1:
-        return out[0]
-    return np.array(out)
+
+def _http_session():
+    session = getattr(_http_local, "session", None)
+    if session is None:
+        # here as requests is an optional dependency, only needed for remote sources
+        import requests  # noqa: PLC0415
+
+        session = _http_local.session = requests.Session()
+    return session
 
 
 def is_url(strg):
@@ -103,7 +358,7 @@ def is_url(strg):
     bool
         True if the string is a URL, False otherwise.
     """
-    return isinstance(strg, str) and re.match(r"http[s]?:[\/]{2}", strg) is not None
+    return isinstance(strg, str) and _URL_RE.match(strg) is not None
 
 
 def utcnow():
@@ -115,8 +370,6 @@ def utcnow():
     datetime
         Current UTC time with timezone information.
     """
-    if sys.version_info[1] < 12:
-        return datetime.utcnow().replace(microsecond=0, tzinfo=ZoneInfo("UTC"))
     return datetime.now(UTC).replace(microsecond=0)
 
 
@@ -124,20 +377,10 @@ def utcnow():
 # Logger setup
 # ======================================================================
 
-# Create logger for the module
+# Create logger for the module. Level and handlers are left to the application
+# (e.g. spectrochempy), records propagate to the root logger.
 logger = logging.getLogger("spectrochempy-omnic")
 
-# Set default level
-logger.setLevel(logging.INFO)
-
-# Create console handler if not already attached
-if not logger.handlers:
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(name)s - %(levelname)s - %(message)s")
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-
 
 # Convenience methods
 
@@ -210,37 +453,57 @@ class OMNICReader:
         In most srs files, the absorbance/intensity data are recorded from high to low
         wavenumbers. However, in some cases the data maybe stored in low to high order.
         In such a case, 'reverse_x' should be set to 'True'.
+    use_memmap : bool, optional
+        Apply only to local files.
+        Whether to memory-map the file instead of reading it at once. Default is None,
+        meaning that only files larger than 1 MiB are memory-mapped.
+    dtype : str or numpy dtype, optional
+        Type of the returned data. Default is None, meaning that the data are returned
+        as float32, as stored in the files.
+    cache : bool, optional
+        Apply only to local files.
+        Default value is False. When set to 'True', the results of the last files read
+        with this option (up to 8 MiB each) are cached, and an unchanged file (same
+        path, modification time and size) read again with the same parameters is not
+        parsed again. This only pays off for files read repeatedly: a first read is
+        slower, as the parsed state is copied. See also `OMNICReader.clear_cache`.
     """
 
     suffix = [".spg", ".spa", ".srs", ".ddr", ".hdr", ".sdr"]
 
-    # Initialize attributes for SPG and SPA files
     _timezone = UTC
-    description = ""
-    data = None
-    units = None
-    title = None
-    name = None
-    filename = None
-    origin = ""
-    original_name = None
-    x = None
-    x_title = None
-    x_units = None
-    y = None
-    y_timestamp = None
-    y_title = None
-    y_units = None
-    y_labels = None
-    mask = None
-    interferogram = False
-    date = None
-    collection_length = None
-    collection_length_units = None
-    optical_velocity = None
-    laser_frequency = None
-    laser_frequency_units = None
-    _history = []
+
+    # the history keeps at most this number of (the last) entries
+    _history_maxlen = 10_000
+
+    # no per-instance __dict__: many readers may be created in batch reads
+    __slots__ = (
+        "description",
+        "data",
+        "units",
+        "title",
+        "name",
+        "filename",
+        "origin",
+        "original_name",
+        "x",
+        "x_title",
+        "x_units",
+        "y",
+        "y_timestamp",
+        "y_title",
+        "y_units",
+        "y_labels",
+        "mask",
+        "interferogram",
+        "date",
+        "collection_length",
+        "collection_length_units",
+        "optical_velocity",
+        "laser_frequency",
+        "laser_frequency_units",
+        "_history",
+    )
 
     # ======================================================================================
     # Initialization and reading
@@ -256,14 +519,150 @@ class OMNICReader:
         **kwargs : dict
             Additional keyword arguments for reading.
         """
+        # Initialize attributes for SPG and SPA files
+        self.description = ""
+        self.data = None
+        self.units = None
+        self.title = None
+        self.name = None
+        self.filename = None
+        self.origin = ""
+        self.original_name = None
+        self.x = None
+        self.x_title = None
+        self.x_units = None
+        self.y = None
+        self.y_timestamp = None
+        self.y_title = None
+        self.y_units = None
+        self.y_labels = None
+        self.mask = None
+        self.interferogram = False
+        self.date = None
+        self.collection_length = None
+        self.collection_length_units = None
+        self.optical_velocity = None
+        self.laser_frequency = None
+        self.laser_frequency_units = None
+        self._history = deque(maxlen=self._history_maxlen)
+
         # Check the source
+        use_cache = kwargs.pop("cache", False)
         source, suffix = self._check_source(source, **kwargs)
 
-        # Get the appropriate reader function dynamically
-        reader_func = getattr(self, f"_read_{suffix[1:]}")
+        # deprecated aliases, replaced before the readers (or the cache) get kwargs
+        for alias, name in (
+            ("return_ifg", "interferogram"),
+            ("return_bg", "background"),
+        ):
+            if alias in kwargs:
+                warnings.warn(
+                    f"The `{alias}` parameter is deprecated, use `{name}` instead.",
+                    DeprecationWarning,
+                    stacklevel=2,
+                )
+                value = kwargs.pop(alias)
+                kwargs[name] = kwargs.get(name) or value
+
+        # an unchanged local file already read is not parsed again
+        cached = _cached_state(source, kwargs) if use_cache else None
+        if cached is not None:
+            state, messages = cached
+            # each reader owns its data and labels, and has its own date and history
+            for name, value in copy.deepcopy(state).items():
+                setattr(self, name, value)
+            if self.date is not None:
+                self.date = utcnow()
+            for message in messages:
+                self.history = message
+            return
+
+        # Get the appropriate reader function and call it
+        reader_func = self._readers[suffix]
+        reader_func(self, source, **kwargs)
 
-        # Call the reader function
-        reader_func(source, **kwargs)
+        # data are read as float32 (as stored), other types on demand only
+        dtype = kwargs.get("dtype")
+        if dtype is not None and self.data is not None:
+            self.data = self.data.astype(dtype, copy=False)
+
+    @classmethod
+    def from_bytes(cls, content, suffix, **kwargs):
+        """
+        Read a file content already loaded in memory.
+
+        Parameters
+        ----------
+        content : bytes-like
+            The content of the file. It is parsed in place (`bytes`) or after a
+            single copy (other bytes-like objects).
+        suffix : str
+            The file type, e.g. ".spg" or "spg".
+        **kwargs : dict
+            Keyword arguments passed to the reader (see `OMNICReader`).
+
+        Returns
+        -------
+        OMNICReader
+            The reader.
+        """
+        if not isinstance(content, bytes):
+            content = bytes(content)
+        return cls(content, suffix=suffix, **kwargs)
+
+    @classmethod
+    def from_path(cls, path, **kwargs):
+        """
+        Read a local file.
+
+        Parameters
+        ----------
+        path : str or Path
+            The path of the file.
+        **kwargs : dict
+            Keyword arguments passed to the reader (see `OMNICReader`).
+
+        Returns
+        -------
+        OMNICReader
+            The reader.
+        """
+        return cls(Path(path), **kwargs)
+
+    @classmethod
+    def read_many(cls, sources, max_workers=None, **kwargs):
+        """
+        Read several data sources concurrently.
+
+        Parameters
+        ----------
+        sources : iterable of str, Path or bytes
+            The data sources to read.
+        max_workers : int, optional
+            Maximum number of reading threads. Default is
+            ``min(32, 4 * os.cpu_count())``, reading being mostly I/O bound.
+        **kwargs : dict
+            Keyword arguments passed to each reader (see `OMNICReader`).
+
+        Returns
+        -------
+        list of OMNICReader
+            The readers, in the order of `sources`.
+        """
+        sources = list(sources)
+        if max_workers is None:
+            max_workers = min(32, 4 * (os.cpu_count() or 1))
+        max_workers = min(max_workers, len(sources))
+        if max_workers <= 1:
+            return [cls(source, **kwargs) for source in sources]
+        # files are independent (each one is opened by its own reader)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda source: cls(source, **kwargs), sources))
+
+    @staticmethod
+    def clear_cache():
+        """Clear the cache of the files read with the `cache` option."""
+        _read_cached.cache_clear()
 
     @property
     def history(self):
@@ -275,15 +674,8 @@ class OMNICReader:
         list of str
             List of timestamped history entries.
         """
-        history = []
-        for date, value in self._history:
-            date = date.astimezone(self._timezone).isoformat(
-                sep=" ",
-                timespec="seconds",
-            )
-            value = str(value).capitalize()
-            history.append(f"{date}> {value}")
-        return history
+        # entries are stored already formatted (see the setter)
+        return list(self._history)
 
     @history.setter
     def history(self, value):
@@ -299,12 +691,14 @@ class OMNICReader:
             return
         if isinstance(value, list):
             # history will be replaced
-            self._history = []
+            self._history.clear()
             if len(value) == 0:
                 return
             value = value[0]
-        date = utcnow()
-        self._history.append((date, value))
+        date = utcnow().astimezone(self._timezone)
+        date = date.isoformat(sep=" ", timespec="seconds")
+        value = str(value).capitalize()
+        self._history.append(f"{date}> {value}")
 
     # ======================================================================================
     # Private methods
@@ -318,7 +712,8 @@ class OMNICReader:
         str
             String representation.
         """
-        return f"OMNICReader: {self.filename.name} {self.data.shape}"
+        name, shape = self._summary()
+        return f"OMNICReader: {name} {shape}"
 
     def __repr__(self):
         """
@@ -329,10 +724,20 @@ class OMNICReader:
         str
             String representation for developers.
         """
-        return f"OMNICReader({self.filename.name}, {self.data.shape})"
+        name, shape = self._summary()
+        return f"OMNICReader({name}, {shape})"
+
+    def _summary(self):
+        # file name and data shape only: the data themselves are never rendered.
+        # A reader may have no data (absent interferogram) or a plain string as
+        # filename (series read from a content)
+        name = getattr(self.filename, "name", self.filename)
+        shape = None if self.data is None else self.data.shape
+        return name, shape
 
     def _read_spg(self, source, **kwargs):
         fid, filename = self._openfid(source, **kwargs)
+        filetype = _detect_filetype(fid.buf)
 
         # Read name:
         # The name starts at position hex 1e = decimal 30. Its max length
@@ -340,7 +745,7 @@ class OMNICReader:
         # won't match with the actual filename if a subsequent renaming has been done in the
         # OS.
 
-        spg_name = self._readbtext(fid, 30, 256)
+        spg_name = self._readbtext(fid.buf, 30, 256)
 
         # Count the number of spectra
         # From hex 120 = decimal 304, individual spectra are described
@@ -368,16 +773,15 @@ class OMNICReader:
         # number of spectra:
 
         # read total number of lines
-        fid.seek(294)
-        nlines = fromfile(fid, "uint16", count=1)
+        nlines = _U16.unpack_from(fid.buf, 294)[0]
 
-        # read "key values"
-        pos = 304
-        keys = np.zeros(nlines)
-        for i in range(nlines):
-            fid.seek(pos)
-            keys[i] = fromfile(fid, dtype="uint8", count=1)
-            pos += 16
+        # read "key values": the whole table of 16-byte lines at once, with the
+        # positions and sizes of the blocks they point to
+        table = np.frombuffer(fid.buf, dtype=_KEY_LINE, count=nlines, offset=304)
+        keys = table["key"].copy()
+        positions = table["pos"].astype("int64")
+        sizes = table["size"].astype("int64")
+        del table  # release the buffer (possibly a mmap closed below)
 
         # the number of occurrences of the key '02' is number of spectra
         nspec = np.count_nonzero(keys == 2)
@@ -398,19 +802,21 @@ class OMNICReader:
         units = []
         titles = []
 
-        # Extracts positions of '02' keys
-        key_is_02 = keys == 2  # ex: [T F F F F T F (...) F T ....]'
-        indices02 = np.nonzero(key_is_02)  # ex: [1 9 ...]
-        position02 = (
-            304 * np.ones(len(indices02[0]), dtype="int") + 16 * indices02[0]
-        )  # ex: [304 432 ...]
+        # positions of the headers ('02' keys)
+        pos_headers = positions[keys == 2].tolist()
 
-        for i in range(nspec):
-            # read the position of the header
-            fid.seek(position02[i] + 2)
-            pos_header = fromfile(fid, dtype="uint32", count=1)
+        # The fields checked below (nx, units, firstx, lastx: bytes 4 to 24 of the
+        # header) must be identical for all spectra: only the first header is parsed,
+        # the others only if their raw fields differ from those of the first one.
+        first_axis_fields = fid.buf[pos_headers[0] + 4 : pos_headers[0] + 24]
+
+        for i, pos_header in enumerate(pos_headers):
             # get infos
-            info = self._read_header(fid, pos_header, is_first_spectrum=(i == 0))
+            axis_fields = fid.buf[pos_header + 4 : pos_header + 24]
+            if i == 0 or axis_fields != first_axis_fields:
+                info = self._read_header(
+                    fid.buf, pos_header, filetype, is_first_spectrum=(i == 0)
+                )
             nx[i] = info["nx"]
             firstx[i] = info["firstx"]
             lastx[i] = info["lastx"]
@@ -420,88 +826,99 @@ class OMNICReader:
             titles.append(info["title"])
 
         # check the consistency of xaxis and data units
-        if np.ptp(nx) != 0:  # pragma: no cover
+        if (nx != nx[0]).any():  # pragma: no cover
             raise OMNICReaderError(
                 "Error : Inconsistent data set -"
                 " number of wavenumber per spectrum should be "
                 "identical",
             )
-        if np.ptp(firstx) != 0:  # pragma: no cover
+        if (firstx != firstx[0]).any():  # pragma: no cover
             raise OMNICReaderError(
                 "Error : Inconsistent data set - the x axis should start at same value",
             )
-        if np.ptp(lastx) != 0:  # pragma: no cover
+        if (lastx != lastx[0]).any():  # pragma: no cover
             raise OMNICReaderError(
                 "Error : Inconsistent data set - the x axis should end at same value",
             )
-        if len(set(xunits)) != 1:  # pragma: no cover
+        if xunits.count(xunits[0]) != nspec:  # pragma: no cover
             raise OMNICReaderError(
                 "Error : Inconsistent data set - data units should be identical",
             )
-        if len(set(units)) != 1:  # pragma: no cover
+        if units.count(units[0]) != nspec:  # pragma: no cover
             raise OMNICReaderError(
                 "Error : Inconsistent data set - x axis units should be identical",
             )
-        data = np.ndarray((nspec, nx[0]), dtype="float32")
-
         # Now the intensity data
 
-        # Extracts positions of '03' keys
-        key_is_03 = keys == 3
-        indices03 = np.nonzero(key_is_03)
-        position03 = 304 * np.ones(len(indices03[0]), dtype="int") + 16 * indices03[0]
-
-        # Read number of spectral intensities
-        for i in range(nspec):
-            data[i, :] = self._getintensities(fid, position03[i])
+        # positions and sizes of the spectral intensities ('03' keys)
+        intensity_pos = positions[keys == 3]
+        intensity_size = sizes[keys == 3]
+
+        rowsize = nx[0] * _NP_DTYPE["float32"].itemsize
+        steps = np.diff(intensity_pos)
+        stride = steps[0] if nspec > 1 else rowsize
+        if (
+            np.all(intensity_size == rowsize)
+            and stride >= rowsize
+            and np.all(steps == stride)
+        ):
+            # spectra stored at regular intervals (e.g. back to back): decode all of
+            # them at once through a strided view of the buffer
+            view = np.ndarray(
+                (nspec, nx[0]),
+                dtype=_NP_DTYPE["float32"],
+                buffer=fid.buf,
+                offset=intensity_pos[0],
+                strides=(stride, _NP_DTYPE["float32"].itemsize),
+            )
+            data = view.copy()
+            del view  # release the buffer (possibly a mmap closed below)
+        else:
+            # decode in a single (nspec, nx) array, row by row
+            data = np.empty((nspec, nx[0]), dtype="float32")
+            position03 = 304 + 16 * np.flatnonzero(keys == 3)
+            for i in range(nspec):
+                self._getintensities(fid.buf, position03[i], out=data[i])
 
         # Get spectra titles & acquisition dates:
         # container to hold values
-        spectitles, acquisitiondates, timestamps = [], [], []
+        spectitles = []
+        raw_timestamps = np.empty(nspec, dtype="int64")
 
-        # Extract positions of '6B' keys (spectra titles & acquisition dates)
-        key_is_6B = keys == 107
-        indices6B = np.nonzero(key_is_6B)
-        position6B = 304 * np.ones(len(indices6B[0]), dtype="int") + 16 * indices6B[0]
+        # positions of the spectra titles & acquisition dates ('6B' keys)
+        pos_titles = positions[keys == 107].tolist()
 
         # Read spectra titles and acquisition date
         for i in range(nspec):
-            # determines the position of informatioon
-            fid.seek(position6B[i] + 2)  # go to line and skip 2 bytes
-            spa_name_pos = fromfile(fid, "uint32", 1)
-
-            # read omnic filename
-            spa_name = self._readbtext(fid, spa_name_pos, 256)
-            spectitles.append(spa_name)
-
-            # and the acquisition date
-            fid.seek(spa_name_pos + 256)
-            timestamp = fromfile(fid, dtype="uint32", count=1)
-            # since 31/12/1899, 00:00
-            acqdate = datetime(1899, 12, 31, 0, 0, tzinfo=UTC) + timedelta(
-                seconds=int(timestamp),
-            )
-            acquisitiondates.append(acqdate)
-            timestamp = acqdate.timestamp()
-            # Transform back to timestamp for storage in the Coord object
-            # use datetime.fromtimestamp(d, timezone.utc))
-            # to transform back to datetime object
-
-            timestamps.append(timestamp)
-
-            # Not used at present
-            # -------------------
-            # extract positions of '1B' codes (history text), sometimes absent,
-            # e.g. peakresolve)
-            #  key_is_1B = (keys == 27)
-            #  indices1B =  # np.nonzero(key_is_1B)
-            #  position1B = 304 * np.ones(len(indices1B[0]), dtype='int') + 16 * indices6B[0]
-            #  if len(position1B) != 0:  # read history texts
-            #     for j in range(nspec):  determine the position of information
-            #        f.seek(position1B[j] + 2)  #
-            #        history_pos = fromfile(f,  'uint32', 1)
-            #        history =  _readbtext(f, history_pos[0])
-            #        allhistories.append(history)
+            spa_name_pos = pos_titles[i]
+
+            # read omnic filename and the acquisition date (seconds since 31/12/1899,
+            # 00:00) which follows
+            spa_name, raw_timestamps[i] = _TITLE.unpack_from(fid.buf, spa_name_pos)
+            spectitles.append(self._decodebtext(spa_name))
+
+        # Transform to timestamps for storage in the Coord object
+        # use datetime.fromtimestamp(d, timezone.utc))
+        # to transform back to datetime object
+        timestamps = raw_timestamps + _OMNIC_EPOCH
+        acquisitiondates = [
+            _OMNIC_EPOCH_DATE + timedelta(seconds=raw)
+            for raw in raw_timestamps.tolist()
+        ]
+
+        # Not used at present
+        # -------------------
+        # extract positions of '1B' codes (history text), sometimes absent,
+        # e.g. peakresolve)
+        #  key_is_1B = (keys == 27)
+        #  indices1B =  # np.nonzero(key_is_1B)
+        #  position1B = 304 * np.ones(len(indices1B[0]), dtype='int') + 16 * indices6B[0]
+        #  if len(position1B) != 0:  # read history texts
+        #     for j in range(nspec):  determine the position of information
+        #        f.seek(position1B[j] + 2)  #
+        #        history_pos = fromfile(f,  'uint32', 1)
+        #        history =  _readbtext(f, history_pos[0])
+        #        allhistories.append(history)
 
         fid.close()
 
@@ -509,18 +926,18 @@ class OMNICReader:
         self.data = data
         self.units = units[0]
         self.title = titles[0]
-        self.name = Path(filename).stem if filename else Path(spg_name).stem
-        self.filename = Path(filename) if filename else Path(spg_name)
+        self.filename = Path(filename or spg_name)
+        self.name = self.filename.stem
         self.origin = "omnic"
         self.original_name = spg_name
 
         # Now get coordinates
-        self.x = np.linspace(firstx[0], lastx[0], nx[0])
+        self.x = np.linspace(firstx[0], lastx[0], nx[0], dtype="float32")
         self.x_title = xtitles[0]
         self.x_units = xunits[0]
 
-        self.y = np.array(timestamps)  # - min(timestamps)
-        self.y_timestamp = min(timestamps)
+        self.y = timestamps  # - min(timestamps)
+        self.y_timestamp = timestamps.min()
         self.y_title = "acquisition timestamp (GMT)"
         self.y_units = "s"
         self.y_labels = (acquisitiondates, spectitles)
@@ -528,35 +945,25 @@ class OMNICReader:
         self.date = utcnow()
         self.history = f"Imported from spg file {self.filename.name}."
 
-    def _read_spa(self, source, **kwargs):
+    def _read_spa(self, source, imported_from="spa", **kwargs):
         fid, filename = self._openfid(source, **kwargs)
-        if "return_ifg" in kwargs:
-            warnings.warn(
-                "The `return_ifg` parameter is deprecated, use `interferogram` instead.",
-                DeprecationWarning,
-                stacklevel=2,
-            )
-        interferogram = kwargs.get("interferogram") or kwargs.get("return_ifg")
+        filetype = _detect_filetype(fid.buf)
+        interferogram = kwargs.get("interferogram")
 
         # Read name:
         # The name  starts at position hex 1e = decimal 30. Its max length
         # is 256 bytes. It is the original filename under which the spectrum has
         # been saved: it won't match with the actual filename if a subsequent
         # renaming has been done in the OS.
-        spa_name = self._readbtext(fid, 30, 256)
+        spa_name = self._readbtext(fid.buf, 30, 256)
 
         # The acquisition date (GMT) is at hex 128 = decimal 296.
         # Second since 31/12/1899, 00:00
-        fid.seek(296)
-        timestamp = fromfile(fid, dtype="uint32", count=1)
-        acqdate = datetime(1899, 12, 31, 0, 0, tzinfo=UTC) + timedelta(
-            seconds=int(timestamp),
-        )
-        acquisitiondate = acqdate
-
-        # Transform back to timestamp for storage in the Coord object
+        # Transform to timestamp for storage in the Coord object
         # use datetime.fromtimestamp(d, timezone.utc)) to transform back to datetime object
-        timestamp = acqdate.timestamp()
+        raw_timestamp = _U32.unpack_from(fid.buf, 296)[0]
+        timestamp = raw_timestamp + _OMNIC_EPOCH
+        acquisitiondate = _OMNIC_EPOCH_DATE + timedelta(seconds=raw_timestamp)
 
         # From hex 120 = decimal 304, the spectrum is described
         # by a block of lines starting with "key values",
@@ -588,64 +995,49 @@ class OMNICReader:
         # they start by '01'. In such cases, the '53' key is also present
         # (before the '1B').
 
-        # scan "key values"
-        pos = 304
-        spa_comments = []  # several custom comments can be present
-        while "continue":
-            fid.seek(pos)
-            key = fromfile(fid, dtype="uint8", count=1)
-
-            # print(key, end=' ; ')
-
-            if key == 2:
-                # read the position of the header
-                fid.seek(pos + 2)
-                pos_header = fromfile(fid, dtype="uint32", count=1)
-                info = self._read_header(fid, pos_header)
-
-            elif key == 3 and interferogram is None:
-                intensities = self._getintensities(fid, pos)
-
-            elif key == 4:
-                fid.seek(pos + 2)
-                comments_pos = fromfile(fid, "uint32", 1)
-                fid.seek(pos + 6)
-                comments_len = fromfile(fid, "uint32", 1)
-                fid.seek(comments_pos)
-                spa_comments.append(fid.read(comments_len).decode("latin-1", "replace"))
-
-            elif key == 27:
-                fid.seek(pos + 2)
-                history_pos = fromfile(fid, "uint32", 1)
-                fid.seek(pos + 6)
-                history_len = fromfile(fid, "uint32", 1)
-                spa_history = self._readbtext(fid, history_pos, history_len)
-
-            elif key == 102 and interferogram == "sample":
-                s_ifg_intensities = self._getintensities(fid, pos)
-
-            elif key == 103 and interferogram == "background":
-                b_ifg_intensities = self._getintensities(fid, pos)
-
-            elif key == 00 or key == 1:
-                break
+        # scan "key values" up to the end of the block, and group the positions of
+        # the lines by key
+        lines = {}
+        for i, key in enumerate(_scan_keys(fid, 304)):
+            lines.setdefault(key, []).append(304 + 16 * i)
+
+        # lines of the spectrum, or of the sample or background interferogram
+        # depending on `interferogram`: if the requested interferogram is absent,
+        # nothing else needs to be read
+        intensity_lines = lines.get(_SPA_INTENSITY_KEYS.get(interferogram), ())
+        if interferogram is not None and not intensity_lines:
+            fid.close()
+            info_("No interferogram found, read_spa returns None")
+            return
 
-            pos += 16
+        # header: read its position (if the key is repeated, the last one is used)
+        for pos in lines.get(2, ()):
+            pos_header = _U32.unpack_from(fid.buf, pos + 2)[0]
+            info = self._read_header(fid.buf, pos_header, filetype)
+
+        # intensities (if the key is repeated, the last one is used)
+        intensities = None
+        for pos in intensity_lines:
+            intensities = self._getintensities(fid.buf, pos)
+
+        # custom comments (several can be present)
+        spa_comments = []
+        for pos in lines.get(4, ()):
+            comments_pos, comments_len = _U32_PAIR.unpack_from(fid.buf, pos + 2)
+            fid.seek(comments_pos)
+            spa_comments.append(fid.read(comments_len).decode("latin-1", "replace"))
+
+        # history
+        spa_history = None
+        for pos in lines.get(27, ()):
+            history_pos, history_len = _U32_PAIR.unpack_from(fid.buf, pos + 2)
+            spa_history = self._readbtext(fid.buf, history_pos, history_len)
 
         fid.close()
 
-        if (interferogram == "sample" and "s_ifg_intensities" not in locals()) or (
-            interferogram == "background" and "b_ifg_intensities" not in locals()
-        ):
-            info_("No interferogram found, read_spa returns None")
-            return
-        if interferogram == "sample":
-            intensities = s_ifg_intensities
-        elif interferogram == "background":
-            intensities = b_ifg_intensities
-
-        # load intensity into the  NDDataset
-        self.data = np.array(intensities[np.newaxis], dtype="float32")
+        # load intensity into the  NDDataset (intensities are already float32: copy
+        # only if the array is a read-only view on the file content)
+        self.data = np.require(intensities[np.newaxis], requirements="W")
 
         if interferogram == "background":
             title = "sample acquisition timestamp (GMT)"  # bckg acquisition date is not known for the moment...
@@ -659,11 +1051,11 @@ class OMNICReader:
         self.y_labels = ([acquisitiondate], [spa_name])
 
         # useful when a part of the spectrum/ifg has been blanked:
-        self.mask = np.isnan(self.data)
+        self.mask = _nan_mask(self.data)
 
         self.interferogram = interferogram is not None
-        self.name = Path(filename).stem if filename else Path(spa_name).stem
-        self.filename = Path(filename) if filename else Path(spa_name)
+        self.filename = Path(filename or spa_name)
+        self.name = self.filename.stem
         self.origin = "omnic"
         self.original_name = spa_name
 
@@ -679,7 +1071,7 @@ class OMNICReader:
             xunit = info["xunits"]
             xtitle = info["xtitle"]
 
-            self.x = np.linspace(firstx, lastx, int(nx))
+            self.x = np.linspace(firstx, lastx, int(nx), dtype="float32")
             self.x_title = xtitle
             self.x_units = xunit
 
@@ -708,9 +1100,9 @@ class OMNICReader:
             for comment in spa_comments:
                 self.description += comment + "\n---------------------\n"
 
-        self.history = "Imported from spa file(s)"
+        self.history = f"Imported from {imported_from} file(s)"
 
-        if "spa_history" in locals() and len("spa_history".strip(" ")) > 0:
+        if spa_history is not None and len(spa_history.strip(" ")) > 0:
             self.history = (
                 "Data processing history from Omnic :\n------------------------------------\n"
                 + spa_history
@@ -720,17 +1112,13 @@ class OMNICReader:
 
     def _read_srs(self, source, **kwargs):
         fid, filename = self._openfid(source, **kwargs)
-        if "return_bg" in kwargs:
-            warnings.warn(
-                "The `return_bg` parameter is deprecated, use `background` instead.",
-                DeprecationWarning,
-                stacklevel=2,
-            )
-        background = kwargs.get("background", False) or kwargs.get("return_bg", False)
+        filetype = _detect_filetype(fid.buf)
+        background = kwargs.get("background", False)
         reverse_x = kwargs.get("reverse_x", False)
 
         # read the file and determine whether it is a rapidscan or a high speed real time
         is_rapidscan, is_highspeed, is_tg = False, False, False
+        history = None  # series history, not available for all types/options
 
         """ At pos=304 (hex:130) is the position of the '02' key for series. Here we don't use it.
         Instead, we use one of the following sequence :
@@ -779,46 +1167,39 @@ class OMNICReader:
         intensities ?
         """
 
-        sub_rs = b"\x02\x00\x00\x00\x18\x00\x00\x00\x00\x00\x48\x43\x00\x50\x43\x47"
-        sub_hs = b"\x02\x00\x00\x00\x18\x00\x00\x00\x00\x00\x48\x43\x00\xc8\xaf\x47"
-        sub_tg = b"\x02\x00\x00\x00\x18\x00\x00\x00\x00\x00"
-
-        # find the first occurence and determine whether the srs is rapidscan or high
-        # speed real time
-        fid.seek(0)
-        bytestring = fid.read()
+        # find all the occurences of the sequence common to all types in a single pass
+        # (in place, without copying the file), then determine whether the srs is
+        # rapidscan, high speed real time or TGA/IR from the bytes which follow
+        index = _find_all(fid.buf, _SRS_TG, 1)
+        index_rs = [pos for pos in index if fid.buf[pos : pos + 16] == _SRS_RS]
+        index_hs = [pos for pos in index if fid.buf[pos : pos + 16] == _SRS_HS]
 
-        # try rapidscan first:
-        pos = bytestring.find(sub_rs, 1)
-        if pos > 0:
+        if index_rs:
+            # rapidscan (tried first)
             is_rapidscan = True
+            index = index_rs
+        elif index_hs:
+            # not rapidscan, high speed real time
+            is_highspeed = True
+            index = index_hs
+        elif index:
+            # neith rapid scan nor high speed real time: TGA/IR
+            is_tg = True
         else:
-            # not rapidscan, try high speed real time
-            pos = bytestring.find(sub_hs, 1)
-            if pos > 0:
-                is_highspeed = True
-            else:
-                # neith rapid scan nor high speed real time, try TGA/IR
-                pos = bytestring.find(sub_tg, 1)
-                if pos > 0:
-                    is_tg = True
-
-                else:
-                    raise OMNICReaderError(
-                        "The reader is only implemented for Rapid Scan, "
-                        "High Speed Real Time, GC or TGA srs files. If you think "
-                        "your file belongs to one of these types, or if "
-                        "you'd like an update of the reader to read your "
-                        "file type, please report the issue on "
-                        "https://github.com/spectrochempy/spectrochempy-omnic"
-                        "/issues ",
-                    )
+            raise OMNICReaderError(
+                "The reader is only implemented for Rapid Scan, "
+                "High Speed Real Time, GC or TGA srs files. If you think "
+                "your file belongs to one of these types, or if "
+                "you'd like an update of the reader to read your "
+                "file type, please report the issue on "
+                "https://github.com/spectrochempy/spectrochempy-omnic"
+                "/issues ",
+            )
 
         if is_rapidscan:
             # determine whether the srs is reprocessed. At pos=292 (hex:124) appears a
             # difference between pristine and reprocessed series
-            fid.seek(292)
-            key = fromfile(fid, dtype="uint8", count=16)[0]
+            key = _U8.unpack_from(fid.buf, 292)[0]
             if key == 39:  # (hex: 27)
                 is_reprocessed = False
             elif key == 15:  # (hex = 0F)
@@ -831,19 +1212,8 @@ class OMNICReader:
                     "/issues ",
                 )
 
-            # find the 2 following starting indexes of sub_rs.
             # we will use the 1st (-> series info), the 2nd (-> background) and
-            # the 3rd  (-> data)
-
-            fid.seek(0)
-            bytestring = fid.read()
-            index = [pos]
-            while pos != -1:
-                pos = bytestring.find(sub_rs, pos + 1)
-                index.append(pos)
-
-            index = np.array(index[:-1]) + [-152, -152, 60]
-
+            # the 3rd  (-> data) occurence of the sequence
             if len(index) != 3:
                 raise OMNICReaderError(
                     "The file is not recognized as a Rapid Scan "
@@ -852,15 +1222,17 @@ class OMNICReader:
                     "/issues ",
                 )
 
+            index = np.array(index) + [-152, -152, 60]
+
             pos_info_data = index[0]
             pos_info_bg = index[1]
             pos_data = index[2]
 
             # read series data, except if the user asks for the background
             if not background:
-                info = self._read_header(fid, pos_info_data)
+                info = self._read_header(fid.buf, pos_info_data, filetype)
                 names, data = self._read_srs_spectra(
-                    fid, pos_data, info["ny"], info["nx"]
+                    fid.buf, pos_data, info["ny"], info["nx"]
                 )
 
                 # now get series history
@@ -870,13 +1242,13 @@ class OMNICReader:
                     # In reprocessed series the updated "DATA PROCESSING HISTORY" is located right after
                     # the following 16 byte sequence:
                     sub = b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff"
-                    pos = bytestring.find(sub) + 16
-                    history = self._readbtext(fid, pos, None)
+                    pos = fid.find(sub) + 16
+                    history = self._readbtext(fid.buf, pos, None)
 
             # read the background if the user asked for it.
             if background:
                 # First get background info
-                info = self._read_header(fid, pos_info_bg)
+                info = self._read_header(fid.buf, pos_info_bg, filetype)
 
                 if "background_name" not in info:
                     # it is a short header
@@ -903,25 +1275,11 @@ class OMNICReader:
                 #         found = True
 
         if is_highspeed:
-            # find the 3 following starting indexes of sub.
+            # the 4 occurences of the sequence.
             # 1st -> series info),
             # 2nd -> background ?
             # 3rd -> data ?
             # 4th  -> ?
-            fid.seek(0)
-            bytestring = fid.read()
-            index = [pos]
-            while pos != -1:
-                pos = bytestring.find(sub_hs, pos + 1)
-                index.append(pos)
-
-            index = np.array(index[:-1]) + [-152, -152, 0, 60]
-
-            pos_info_data = index[0]
-            pos_bg = index[1]
-            pos_x = index[2]
-            pos_data = index[3]
-
             if len(index) != 4:
                 raise OMNICReaderError(
                     "The file is not recognized as a High Speed Real "
@@ -930,12 +1288,19 @@ class OMNICReader:
                     "/issues ",
                 )
 
+            index = np.array(index) + [-152, -152, 0, 60]
+
+            pos_info_data = index[0]
+            pos_bg = index[1]
+            # index[2] is not used
+            pos_data = index[3]
+
             if not background:
-                info = self._read_header(fid, pos_info_data)
+                info = self._read_header(fid.buf, pos_info_data, filetype)
                 # container for names and data
 
                 names, data = self._read_srs_spectra(
-                    fid, pos_data, info["ny"], info["nx"]
+                    fid.buf, pos_data, info["ny"], info["nx"]
                 )
 
                 # Get series history. on the sample file, the history seems overwritten by
@@ -945,14 +1310,14 @@ class OMNICReader:
                 sub = (
                     b"\x00\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff"
                 )
-                pos = bytestring.find(sub) + 16
-                history = self._readbtext(fid, pos, None)
+                pos = fid.find(sub) + 16
+                history = self._readbtext(fid.buf, pos, None)
 
                 # read the background if the user asked for it.
 
             elif background:
                 # First get background info
-                info = self._read_header(fid, pos_bg)
+                info = self._read_header(fid.buf, pos_bg, filetype)
 
                 if "background_name" not in info:
                     # it is a short header
@@ -964,15 +1329,6 @@ class OMNICReader:
                     return
 
         if is_tg:
-            fid.seek(0)
-            bytestring = fid.read()
-            index = [pos]
-            while pos != -1:
-                pos = bytestring.find(sub_tg, pos + 1)
-                index.append(pos)
-
-            index = np.array(index[:-1]) + [-152, -152, 60]
-
             if len(index) != 3:
                 raise OMNICReaderError(
                     "The file is not recognized as a TG IR or GC "
@@ -981,15 +1337,17 @@ class OMNICReader:
                     "/issues ",
                 )
 
+            index = np.array(index) + [-152, -152, 60]
+
             pos_info_data = index[0]
             pos_info_bg = index[1]
             pos_data = index[2]
 
             # read series data, except if the user asks for the background
             if not background:
-                info = self._read_header(fid, pos_info_data)
+                info = self._read_header(fid.buf, pos_info_data, filetype)
                 names, data = self._read_srs_spectra(
-                    fid, pos_data, info["ny"], info["nx"]
+                    fid.buf, pos_data, info["ny"], info["nx"]
                 )
                 # Note: info["history"] is empty in TG IR or GC series
                 # the position of the history is indiated at pos 856 or 878 depending on the
@@ -998,7 +1356,7 @@ class OMNICReader:
             # read the background if the user asked for it.
             if background:
                 # First get background info
-                info = self._read_header(fid, pos_info_bg)
+                info = self._read_header(fid.buf, pos_info_bg, filetype)
 
                 if "background_name" not in info:
                     # it is a short header
@@ -1010,30 +1368,41 @@ class OMNICReader:
                     return
 
         if not background:
+            # reversing is a negative-stride view (no copy), so the data may not be
+            # C-contiguous
             self.data = data if not reverse_x else data[:, ::-1]
         else:
-            self.data = np.expand_dims(data, axis=0)
+            # copy only if the array read from the file is a read-only view
+            self.data = np.require(data[np.newaxis], requirements="W")
 
         # in case part of the spectra/ifg has been blanked:
-        self.mask = np.isnan(self.data)
+        self.mask = _nan_mask(self.data)
 
         self.units = info["units"]
         self.title = info["title"]
-        self.name = Path(filename).stem if filename else "unnamed"
-        self.filename = Path(filename) if filename else "unknown"
+        if filename:
+            self.filename = Path(filename)
+            self.name = self.filename.stem
+        else:
+            self.filename = "unknown"
+            self.name = "unnamed"
         self.origin = "omnic"
 
         # now add coordinates
-        self.x = np.linspace(info["firstx"], info["lastx"], int(info["nx"]))
+        # (float32, like the data)
+        self.x = np.linspace(
+            info["firstx"], info["lastx"], int(info["nx"]), dtype="float32"
+        )
         self.x_title = info["xtitle"]
         self.x_units = info["xunits"]
 
         # specific infos for series data
         if not background:
             self.name = info["name"]
-            self.y = np.around(
-                np.linspace(info["firsty"], info["lasty"], info["ny"]), 3
+            self.y = np.linspace(
+                info["firsty"], info["lasty"], info["ny"], dtype="float32"
             )
+            np.around(self.y, 3, out=self.y)
             self.y_title = "Time"
             self.y_units = "minute"
             self.y_labels = names
@@ -1041,10 +1410,10 @@ class OMNICReader:
         else:
             self.y = np.array([0], dtype="float32")
         self.y_timestamp = min(self.y)
-        if "history" in locals():
+        if history is not None:
             self.history = (
                 "Omnic 'DATA PROCESSING HISTORY' :\n"
-                "--------------------------------\n" + history,
+                "--------------------------------\n" + history
             )
         self.history = " imported from srs file " + str(self.filename)
 
@@ -1060,16 +1429,23 @@ class OMNICReader:
         fid.close()
 
     def _read_ddr(self, *args, **kwargs):
-        self._read_spa(*args, **kwargs)
-        self.history[-1] = "Imported from ddr file(s)"
+        self._read_spa(*args, imported_from="ddr", **kwargs)
 
     def _read_hdr(self, *args, **kwargs):
-        self._read_spa(*args, **kwargs)
-        self.history[-1] = "Imported from hdr file(s)"
+        self._read_spa(*args, imported_from="hdr", **kwargs)
 
     def _read_sdr(self, *args, **kwargs):
-        self._read_spa(*args, **kwargs)
-        self.history[-1] = "Imported from sdr file(s)"
+        self._read_spa(*args, imported_from="sdr", **kwargs)
+
+    # reader of each (lower case) suffix
+    _readers = {
+        ".spg": _read_spg,
+        ".spa": _read_spa,
+        ".srs": _read_srs,
+        ".ddr": _read_ddr,
+        ".hdr": _read_hdr,
+        ".sdr": _read_sdr,
+    }
 
     def _get_suffix_from_kwargs(self, **kwargs):
         suffix = kwargs.get("protocol") or kwargs.get("suffix")
@@ -1104,10 +1480,12 @@ class OMNICReader:
         kw_suffix = self._get_suffix_from_kwargs(**kwargs)
 
         if is_url(source):
-            suffix = Path(source).suffix.lower()
-            return source, kw_suffix if suffix not in self.suffix else suffix
+            # suffix of the path only (not of a query string or fragment)
+            suffix = Path(urlsplit(source).path).suffix.lower()
+            if suffix not in self._readers:
+                suffix = kw_suffix
 
-        if not isinstance(source, bytes | dict):
+        elif not isinstance(source, bytes | dict):
             # Check if source is a string or Path object
             if not isinstance(source, Path):
                 try:
@@ -1123,15 +1501,7 @@ class OMNICReader:
                     f"File has no suffix and suffix (or protocol) parameter is not provided in kwargs. Expected one of {self.suffix}"
                 )
 
-            # Check if source is a valid file path
-            if not source.exists():
-                raise OMNICReaderError(f"File not found: {source}")
-
             suffix = source.suffix.lower() if source.suffix else kw_suffix
-            if suffix not in self.suffix:
-                raise OMNICReaderError(
-                    f"Invalid suffix: {suffix}. Expected one of {self.suffix}"
-                )
 
         else:  # source is a content
             # Check if suffix is provided
@@ -1142,18 +1512,18 @@ class OMNICReader:
                     raise OMNICReaderError(
                         "When using dict content, the dict must contain a single element. (multiple content reading not yet supported)"
                     )
-                suffix = Path(list(source.keys())[0]).suffix.lower()
+                suffix = Path(next(iter(source))).suffix.lower()
             if suffix is None:
                 raise OMNICReaderError(
                     "When using bytes content, the suffix must be provided as a filename suffix or "
                     "in kwargs (using protocol or suffix parameter)."
                 )
-            # Validate the provided suffix
-            if suffix not in self.suffix:
-                raise OMNICReaderError(
-                    f"Invalid suffix: {suffix}. Expected one of {self.suffix}"
-                )
 
+        # Validate the suffix (a single check, whatever the source)
+        if suffix not in self._readers:
+            raise OMNICReaderError(
+                f"Invalid suffix: {suffix}. Expected one of {self.suffix}"
+            )
         return source, suffix
 
     def _openfid(self, source, mode="rb", **kwargs):
@@ -1181,20 +1551,19 @@ class OMNICReader:
         filename = None
 
         if is_url(source):
-            # use request to read the remote content
-            r = requests.get(source, allow_redirects=True, timeout=10)
+            # the remote content is read at once and parsed from memory
+            r = _http_session().get(source, allow_redirects=True, timeout=10)
             r.raise_for_status()
             content = r.content
             encoding = r.encoding
-            filename = Path(source).name
+            # name from the path only (not from a query string or fragment)
+            filename = Path(urlsplit(source).path).name
 
         elif isinstance(source, bytes):
-            # use BytesIO to read the bytes content
             content = source
 
         elif isinstance(source, dict):
-            content = list(source.values())[0]
-            filename = list(source.keys())[0]
+            filename, content = next(iter(source.items()))
 
         else:
             # transform filename to a Path object if not yet the case
@@ -1204,27 +1573,48 @@ class OMNICReader:
         if content is not None:
             # if a content has been passed
             fid = (
-                io.BytesIO(content)
+                _Cursor(content)
                 if mode == "rb"
                 else io.StringIO(content.decode(encoding))
             )
+        elif mode == "rb":
+            # all subsequent reads are done in memory: OMNIC files are read at once
+            # (a single syscall), very large ones are memory-mapped
+            use_memmap = kwargs.get("use_memmap")
+            try:
+                f = open(filename, mode=mode)  # noqa: SIM115
+            except FileNotFoundError as e:
+                # no prior existence check: a single syscall, and no race with it
+                raise OMNICReaderError(f"File not found: {filename}") from e
+            with f:
+                size = os.fstat(f.fileno()).st_size
+                if use_memmap is None:
+                    use_memmap = size > _MMAP_THRESHOLD
+                if use_memmap and size > 0:
+                    buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    buf = f.read()
+            fid = _Cursor(buf)
         else:
             fid = open(filename, mode=mode)  # noqa: SIM115
 
         return fid, filename
 
-    def _read_header(self, fid, pos,is_first_spectrum=True):
+    def _read_header(self, buf, pos, filetype, is_first_spectrum=True):
         r"""
         Read spectrum/ifg/series header.
 
         Parameters
         ----------
-        fid : BufferedReader
-            The buffered binary stream.
+        buf : bytes or mmap.mmap
+            The content of the file.
 
         pos : int
             The position of the header (see Notes).
 
+        filetype : str
+            The type of file, as returned by `_detect_filetype`.
+
         is_first_spectrum : bool, optional
             Indicates if this is the first spectrum being read. Default is True.
 
@@ -1290,176 +1680,134 @@ class OMNICReader:
 
         """
         out = {}
-        # determine the type of file
-        fid.seek(0)
-        bytes = fid.read(18)
-        if bytes == b"Spectral Data File":
-            filetype = "spa, spg"
-        elif bytes == b"Spectral Exte File":
-            filetype = "srs"
+
+        # fixed-offset fields, decoded at once
+        fields = dict(zip(_HEADER_FIELDS, _HEADER.unpack_from(buf, pos), strict=True))
 
         # nx
-        fid.seek(pos + 4)
-        out["nx"] = fromfile(fid, "uint32", count=1)
+        out["nx"] = fields["nx"]
 
         # xunits
-        fid.seek(pos + 8)
-        key = fromfile(fid, dtype="uint8", count=1)
-        if key == 1:
-            out["xunits"] = "cm^-1"
-            out["xtitle"] = "wavenumbers"
-        elif key == 2:
-            out["xunits"] = None
-            out["xtitle"] = "data points"
-        elif key == 3:  # pragma: no cover
-            out["xunits"] = "nm"
-            out["xtitle"] = "wavelengths"
-        elif key == 4:  # pragma: no cover
-            out["xunits"] = "um"
-            out["xtitle"] = "wavelengths"
-        elif key == 32:  # pragma: no cover
-            out["xunits"] = "cm^-1"
-            out["xtitle"] = "raman shift"
+        key = fields["xunits_key"]
+        if key in _XUNITS:
+            out["xunits"], out["xtitle"] = _XUNITS[key]
         else:  # pragma: no cover
             out["xunits"] = None
             out["xtitle"] = "xaxis"
-            info_("The nature of x data is not recognized, xtitle is set to 'xaxis'")
+            if is_first_spectrum:
+                info_(
+                    "The nature of x data is not recognized, xtitle is set to 'xaxis'"
+                )
 
         # data units
-        fid.seek(pos + 12)
-        key = fromfile(fid, dtype="uint8", count=1)
-        if key == 17:
-            out["units"] = "absorbance"
-            out["title"] = "absorbance"
-        elif key == 16:  # pragma: no cover
-            out["units"] = "percent"
-            out["title"] = "transmittance"
-        elif key == 11:  # pragma: no cover
-            out["units"] = "percent"
-            out["title"] = "reflectance"
-        elif key == 12:  # pragma: no cover
-            out["units"] = None
-            out["title"] = "log(1/R)"
-        elif key == 15:  # pragma: no cover
-            out["units"] = None
-            out["title"] = "single beam"
-        elif key == 20:  # pragma: no cover
-            out["units"] = "Kubelka_Munk"
-            out["title"] = "Kubelka-Munk"
-        elif key == 21:
-            out["units"] = None
-            out["title"] = "reflectance"
-        elif key == 22:
-            out["units"] = "V"
-            out["title"] = "detector signal"
-        elif key == 26:  # pragma: no cover
-            out["units"] = None
-            out["title"] = "photoacoustic"
-        elif key == 31:  # pragma: no cover
-            out["units"] = None
-            out["title"] = "Raman intensity"
+        key = fields["units_key"]
+        if key in _UNITS:
+            out["units"], out["title"] = _UNITS[key]
         else:  # pragma: no cover
             out["units"] = None
             out["title"] = "intensity"
             if is_first_spectrum:
-                info_(f"The nature of data is not recognized (key == {key}), title set to 'Intensity'")
-
-        # firstx, lastx
-        fid.seek(pos + 16)
-        out["firstx"] = fromfile(fid, "float32", 1)
-        fid.seek(pos + 20)
-        out["lastx"] = fromfile(fid, "float32", 1)
-        fid.seek(pos + 28)
-
-        out["scan_pts"] = fromfile(fid, "uint32", 1)
-        fid.seek(pos + 32)
-        out["zpd"] = fromfile(fid, "uint32", 1)
-        fid.seek(pos + 36)
-        out["nscan"] = fromfile(fid, "uint32", 1)
-        fid.seek(pos + 52)
-        out["nbkgscan"] = fromfile(fid, "uint32", 1)
-        fid.seek(pos + 68)
-        out["collection_length"] = fromfile(fid, "uint32", 1)
-        fid.seek(pos + 80)
-        out["reference_frequency"] = fromfile(fid, "float32", 1)
-        fid.seek(pos + 188)
-        out["optical_velocity"] = fromfile(fid, "float32", 1)
+                info_(
+                    f"The nature of data is not recognized (key == {key}), "
+                    "title set to 'Intensity'"
+                )
+
+        # firstx, lastx, scan_pts, zpd, nscan, nbkgscan, collection_length,
+        # reference_frequency, optical_velocity
+        for name in _HEADER_FIELDS[3:]:
+            out[name] = fields[name]
 
         if filetype == "spa, spg":
-            out["history"] = self._readbtext(fid, pos + 208, None)
+            out["history"] = self._readbtext(buf, pos + 208, None)
 
         if filetype == "srs":
             if out["nbkgscan"] == 0 and out["firstx"] > out["lastx"]:
                 # an interferogram in rapid scan mode
                 out["firstx"], out["lastx"] = out["lastx"], out["firstx"]
 
-            out["name"] = self._readbtext(fid, pos + 938, 256)
+            out["name"] = self._readbtext(buf, pos + 938, 256)
             # Hack because name seems not to be well read for srs
             out["name"] = out["name"].split("\n")[0]
-            fid.seek(pos + 1002)
-            out["collection_length"] = fromfile(fid, "float32", 1) * 60
-            fid.seek(pos + 1006)
-            out["lasty"] = fromfile(fid, "float32", 1)
-            fid.seek(pos + 1010)
-            out["firsty"] = fromfile(fid, "float32", 1)
-            fid.seek(pos + 1026)
-            out["ny"] = fromfile(fid, "uint32", 1)
+            fields = dict(
+                zip(
+                    _SRS_HEADER_FIELDS,
+                    _SRS_HEADER.unpack_from(buf, pos + 1002),
+                    strict=True,
+                )
+            )
+            out["collection_length"] = fields["collection_length"] * 60
+            out["lasty"] = fields["lasty"]
+            out["firsty"] = fields["firsty"]
+            out["ny"] = fields["ny"]
             #  y unit could be at pos+1030 with 01 = minutes ?
-            out["history"] = self._readbtext(fid, pos + 1200, None)
+            out["history"] = self._readbtext(buf, pos + 1200, None)
 
-            if self._readbtext(fid, pos + 208, 256)[:10] == "Background":
+            text = self._readbtext(buf, pos + 208, 256)
+            if text[:10] == "Background":
                 # it is the header of a background
-                out["background_name"] = self._readbtext(fid, pos + 208, 256)[10:]
+                out["background_name"] = text[10:]
 
         return out
 
-    def _read_srs_spectra(self, fid, pos_data, n_spectra, n_points):
+    def _read_srs_spectra(self, buf, pos_data, n_spectra, n_points):
         """
         Read the spectra/interferogram names and data of a series.
 
-        fid: BufferedReader
+        buf: bytes or mmap.mmap
         pos_data: int
         n_spectra: int
         n_points: int
 
         returns: names (list), spectral data (ndarray)
         """
-        # container for names and data
-        names = []
-        data = np.zeros((n_spectra, n_points))
-
-        # read the spectra/interferogram names and data
-        # the first one....
-        pos = pos_data
-        names.append(self._readbtext(fid, pos, 256))
-        pos += 84
-        fid.seek(pos)
-        data[0, :] = fromfile(fid, dtype="float32", count=n_points)[:]
-        pos += n_points * 4
-        # ... and the remaining ones:
-        for i in np.arange(n_spectra)[1:]:
-            pos += 16
-            names.append(self._readbtext(fid, pos, 256))
-            pos += 84
-            fid.seek(pos)
-            data[i, :] = fromfile(fid, dtype="float32", count=n_points)[:]
-            pos += n_points * 4
+        # Each spectrum/interferogram is stored as a record of 100 + 4 * n_points
+        # bytes: its name (84 bytes), its data (float32), and a 16-byte gap before the
+        # next record.
+        stride = 100 + 4 * n_points
+
+        # read the spectra/interferogram names...
+        names = [
+            self._readbtext(buf, pos, 256)
+            for pos in range(pos_data, pos_data + n_spectra * stride, stride)
+        ]
+
+        # ... and all the data at once, through a strided view of the buffer
+        view = np.ndarray(
+            (n_spectra, n_points),
+            dtype=_NP_DTYPE["float32"],
+            buffer=buf,
+            offset=pos_data + 84,
+            strides=(stride, _NP_DTYPE["float32"].itemsize),
+        )
+        data = view.copy()
+        del view  # release the buffer (possibly a mmap closed afterwards)
 
         return names, data
 
     @staticmethod
-    def _readbtext(fid, pos, size):
+    def _readbtext(buf, pos, size):
         # Read some text in binary file of given size. If size is None, the etxt is read
         # until b\0\ is encountered.
         # Returns utf-8 string
-        fid.seek(pos)
         if size is None:
-            btext = b""
-            while fid.read(1) != b"\x00":
-                btext += fid.read(1)
+            # locate the terminator directly in the buffer
+            end = buf.find(b"\x00", pos)
+            btext = buf[pos:end] if end != -1 else buf[pos:]
         else:
-            btext = fid.read(size)
-        btext = re.sub(b"\x00+", b"\n", btext)
+            btext = buf[pos : pos + size]
+        return OMNICReader._decodebtext(btext)
+
+    @staticmethod
+    def _decodebtext(btext):
+        # Decode some text read in binary file: sequences of b\0\ are replaced by
+        # newlines (leading and trailing ones being removed).
+        # Returns utf-8 string
+        end = btext.find(b"\x00")
+        if end != -1 and btext.count(b"\x00", end) == len(btext) - end:
+            # only a b\0\ padding (fixed-width fields): no need for the regex
+            btext = btext[:end] + b"\n"
+        elif end != -1:
+            btext = re.sub(b"\x00+", b"\n", btext)
 
         if btext[:1] == b"\n":
             btext = btext[1:]
@@ -1482,20 +1830,25 @@ class OMNICReader:
         return 16 * (1 + pos // 16)
 
     @staticmethod
-    def _getintensities(fid, pos):
+    def _getintensities(buf, pos, out=None):
         # get intensities from the 03 (spectrum)
         # or 66 (sample ifg) or 67 (bg ifg) key,
-        # returns a ndarray
+        # returns a ndarray (decoded into out if provided)
 
-        fid.seek(pos + 2)  # skip 2 bytes
-        intensity_pos = fromfile(fid, "uint32", 1)
-        fid.seek(pos + 6)
-        intensity_size = fromfile(fid, "uint32", 1)
-        nintensities = int(intensity_size / 4)
+        intensity_pos, intensity_size = _U32_PAIR.unpack_from(buf, pos + 2)
+        nintensities = intensity_size // _NP_DTYPE["float32"].itemsize
 
-        # Read and return spectral intensities
-        fid.seek(intensity_pos)
-        return fromfile(fid, "float32", int(nintensities))
+        # Decode the spectral intensities straight from the buffer; the view is
+        # copied, as the buffer may be a mmap closed once the file is read
+        view = np.frombuffer(
+            buf, dtype=_NP_DTYPE["float32"], count=nintensities, offset=intensity_pos
+        )
+        if out is None:
+            out = view.copy()
+        else:
+            out[:] = view
+        del view
+        return out
 
 
 if __name__ == "__main__":
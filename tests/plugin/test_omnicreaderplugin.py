@@ -44,6 +44,10 @@ class TestOMNICReaderPlugin:
             def __new__(cls, *args, **kwargs):
                 return mock_instance
 
+            @classmethod
+            def read_many(cls, sources, **kwargs):
+                return [cls(source, **kwargs) for source in sources]
+
         # Apply the monkeypatch
         monkeypatch.setattr(
             "spectrochempy_omnic.plugin.omnicreaderplugin.OMNICReader", MockOMNICReader
@@ -73,6 +77,10 @@ class TestOMNICReaderPlugin:
                 call_args.append((file, kwargs))
                 mock_instances.append(self)
 
+            @classmethod
+            def read_many(cls, sources, **kwargs):
+                return [cls(source, **kwargs) for source in sources]
+
         # Apply the monkeypatch
         monkeypatch.setattr(
             "spectrochempy_omnic.plugin.omnicreaderplugin.OMNICReader", MockOMNICReader
@@ -91,3 +99,33 @@ class TestOMNICReaderPlugin:
         # Verify all files were passed to the reader
         for i, file in enumerate(test_files):
             assert call_args[i][0] == file
+
+    def test_read_file_read_many(self, monkeypatch):
+        """Test that files are read as a batch, keeping the files order."""
+        read_many_args = []
+
+        # Create a mock OMNICReader class
+        class MockOMNICReader:
+            def __init__(self, file, **kwargs):
+                self.file = file
+                # the last file has no data and must be discarded
+                self.data = None if file == "last.spa" else "mock_data"
+
+            @classmethod
+            def read_many(cls, sources, **kwargs):
+                read_many_args.append((sources, kwargs))
+                return [cls(source, **kwargs) for source in sources]
+
+        # Apply the monkeypatch
+        monkeypatch.setattr(
+            "spectrochempy_omnic.plugin.omnicreaderplugin.OMNICReader", MockOMNICReader
+        )
+
+        # Call method
+        plugin = OMNICReaderPlugin()
+        test_files = [f"test{i}.spa" for i in range(16)]
+        result = plugin.read_file([*test_files, "last.spa"], protocol="spa")
+
+        # Assertions
+        assert read_many_args == [([*test_files, "last.spa"], {"protocol": "spa"})]
+        assert [nd.file for nd in result] == test_files
@@ -5,6 +5,7 @@
 # ======================================================================================
 # ruff: noqa
 
+import numpy as np
 import pytest
 from pathlib import Path
 
@@ -41,6 +42,21 @@ class TestOMNICReaderBasics:
         # Check string representation
         assert str(nd1) == f"OMNICReader: {nd1.filename.name} {nd1.data.shape}"
 
+    @pytest.mark.parametrize("use_memmap", [True, False])
+    def test_read_spg_file_memmap(self, use_memmap):
+        """Test reading an SPG file with and without memory-mapping."""
+        nd = OMNICReader(IRDATA / "nh4y-activation.spg", use_memmap=use_memmap)
+        assert nd.data.shape == (55, 5549)
+        assert nd.data.flags.writeable
+
+    def test_read_spg_file_dtype(self):
+        """Test the type of the data read, float32 unless requested otherwise."""
+        nd = OMNICReader(IRDATA / "nh4y-activation.spg")
+        assert nd.data.dtype == "float32"
+        nd64 = OMNICReader(IRDATA / "nh4y-activation.spg", dtype="float64")
+        assert nd64.data.dtype == "float64"
+        assert (nd64.data == nd.data).all()
+
     def test_read_spg_binary_content(self):
         """Test reading SPG content from binary data."""
         filename_wodger = IRDATA / "wodger.spg"
@@ -56,6 +72,11 @@ class TestOMNICReaderBasics:
         assert nd2.data.shape == nd1.data.shape
         assert nd2.x.size == nd2.data.shape[1]
 
+        # Test with the explicit constructors
+        nd3 = OMNICReader.from_bytes(bytearray(content), "spg")
+        nd4 = OMNICReader.from_path(str(filename_wodger))
+        assert (nd3.data == nd1.data).all() and (nd4.data == nd1.data).all()
+
         # Test error when suffix not provided with binary content
         with pytest.raises(
             OMNICReaderError,
@@ -81,6 +102,21 @@ class TestSPAFiles:
         nd2 = OMNICReader(IRDATA / "subdir" / "20-50" / "7_CZ0-100_Pd_21.SPA")
         assert nd.data.shape == nd2.data.shape
 
+    def test_read_many(self):
+        """Test reading several SPA files at once."""
+        files = sorted((IRDATA / "subdir").glob("*.SPA"))
+        assert len(files) > 1
+        nds = OMNICReader.read_many(files, max_workers=4, cache=False)
+        assert [nd.filename.name for nd in nds] == [f.name for f in files]
+        assert all(nd.data.shape == (1, 5549) for nd in nds)
+
+        # same readers, in the same order, as when the files are read one at a time
+        expected = [OMNICReader(f, cache=False) for f in files]
+        for nd, nd_expected in zip(nds, expected):
+            assert nd.filename == nd_expected.filename
+            assert np.array_equal(nd.data, nd_expected.data, equal_nan=True)
+            assert np.array_equal(nd.x, nd_expected.x)
+
 
 class TestInterferograms:
     """Tests for reading interferogram data from OMNIC files."""
@@ -103,6 +139,18 @@ class TestInterferograms:
             IRDATA / "subdir" / "20-50" / "7_CZ0-100_Pd_21.SPA", interferogram="sample"
         )
         assert a.data is None
+        assert str(a) == "OMNICReader: None None"
+
+    def test_read_nonexistent_interferogram_hdr(self):
+        """Test hdr files, read as spa, without the requested interferogram."""
+        content = (IRDATA / "subdir" / "20-50" / "7_CZ0-100_Pd_21.SPA").read_bytes()
+        a = OMNICReader.from_bytes(content, suffix="hdr", interferogram="sample")
+        assert a.data is None
+        assert a.history == []
+
+        b = OMNICReader.from_bytes(content, suffix="hdr")
+        assert b.data is not None
+        assert any("Imported from hdr file(s)" in h for h in b.history)
 
 
 class TestOMNICSeries:
@@ -186,6 +234,16 @@ class TestUtilityFunctions:
         # Just verify it returns a non-None value (actual value will change)
         assert reader._check_source.__globals__["utcnow"]() is not None
 
+    def test_nan_mask(self):
+        """Test the NaN mask of full, blanked and empty series."""
+        nan_mask = OMNICReader._check_source.__globals__["_nan_mask"]
+        data = np.ones((2, 3), dtype="float32")
+        assert nan_mask(data) is None
+        data[1, 2] = np.nan
+        assert nan_mask(data).tolist() == [[False] * 3, [False, False, True]]
+        # an empty series has no blanked values
+        assert nan_mask(np.empty((0, 3), dtype="float32")) is None
+
 
 class TestReaderMethods:
     """Tests for specific reader methods."""
@@ -208,6 +266,41 @@ class TestReaderMethods:
         reader.history = None
         assert len(reader.history) == 0
 
+    def test_read_same_file_twice(self):
+        """Test that readers of the same (cached) file do not share their data."""
+        nd1 = OMNICReader(IRDATA / "nh4y-activation.spg", cache=True)
+        nd2 = OMNICReader(IRDATA / "nh4y-activation.spg", cache=True)
+        nd3 = OMNICReader(IRDATA / "nh4y-activation.spg")
+        assert (nd2.data == nd1.data).all() and (nd3.data == nd1.data).all()
+
+        nd2.data[0, 0] = -1.0
+        nd2.y_labels[1][0] = "Test title"
+        nd2.history = "Test history entry"
+        assert nd1.data[0, 0] != -1.0
+        assert nd1.y_labels[1][0] != "Test title"
+        assert len(nd1.history) == len(nd2.history) - 1
+
+        # a later read is not affected by the changes made to the previous readers
+        nd4 = OMNICReader(IRDATA / "nh4y-activation.spg", cache=True)
+        assert nd4.data[0, 0] == nd3.data[0, 0]
+        assert nd4.y_labels[1] == nd3.y_labels[1]
+        assert len(nd4.history) == len(nd3.history)
+
+        # deprecated parameters are reported at each read
+        for _ in range(2):
+            with pytest.warns(DeprecationWarning):
+                OMNICReader(
+                    IRDATA / "carroucell_samp" / "2-BaSO4_0.SPA",
+                    return_ifg="sample",
+                    cache=True,
+                )
+
+        # the cache is opt-in: files read without the option are not kept
+        OMNICReader.clear_cache()
+        OMNICReader(IRDATA / "nh4y-activation.spg")
+        cache_info = OMNICReader.clear_cache.__globals__["_read_cached"].cache_info()
+        assert cache_info.currsize == 0
+
     def test_string_representations(self):
         """Test string representations (__str__ and __repr__)."""
         reader = OMNICReader(IRDATA / "nh4y-activation.spg")